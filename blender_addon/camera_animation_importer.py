@@ -14,7 +14,167 @@ import math
 from pathlib import Path
 from bpy.props import StringProperty, BoolProperty, FloatProperty, EnumProperty, IntProperty
 from bpy_extras.io_utils import ImportHelper, ExportHelper
-from mathutils import Vector, Quaternion, Euler
+from mathutils import Quaternion, Euler
+
+
+def _read_json(filepath):
+    """Parse a JSON file, using orjson when it is available"""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def _write_json(filepath, data):
+    """Write indented JSON, using orjson when it is available"""
+    try:
+        import orjson
+    except ImportError:
+        raw = json.dumps(data, indent=2).encode('utf-8')
+    else:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    with open(filepath, 'wb') as f:
+        f.write(raw)
+
+
+def _parse_frames(frames):
+    """Transpose WebXR frame dicts into time (N,), quaternion (N,4 WXYZ) and position (N,3) arrays"""
+    import numpy as np
+    times = np.fromiter((f['t'] for f in frames), dtype=np.float64, count=len(frames))
+    # Quaternions are XYZW in JSON -> WXYZ in Blender
+    q = np.array([f['q'] for f in frames], dtype=np.float64)[:, [3, 0, 1, 2]]
+    # Frames without position data sit at the origin
+    p = np.array([f.get('p') or (0.0, 0.0, 0.0) for f in frames], dtype=np.float64)
+    return times, q, p
+
+
+def _motion_keys(p, q, position_tolerance, rotation_tolerance):
+    """Mask of samples to keyframe: both ends plus the samples where the pose leaves the last kept key"""
+    import numpy as np
+    # A tolerance of 0 leaves that channel out of the test
+    check_position = position_tolerance > 0.0
+    check_rotation = rotation_tolerance > 0.0
+    # The angle between unit quaternions a and b is 2 * acos(|a . b|)
+    min_alignment = math.cos(rotation_tolerance / 2)
+    near_alignment = math.cos(rotation_tolerance / 4)
+    near_distance = position_tolerance / 2
+    q = q / np.linalg.norm(q, axis=1, keepdims=True)
+    
+    p = p.tolist()
+    q = q.tolist()
+    dist = math.dist
+    
+    def off_course(start, middle, end):
+        # Whether the pose at middle strays over half a tolerance from the straight blend of start and end
+        f = (middle - start) / (end - start)
+        if check_position:
+            expected = [a + f * (b - a) for a, b in zip(p[start], p[end])]
+            if dist(expected, p[middle]) > near_distance:
+                return True
+        if check_rotation:
+            expected = [a + f * (b - a) for a, b in zip(q[start], q[end])]
+            alignment = abs(sum(a * b for a, b in zip(expected, q[middle])))
+            if alignment < near_alignment * math.hypot(*expected):
+                return True
+        return False
+    keep = np.zeros(len(p), dtype=bool)
+    keep[0] = keep[-1] = True
+    
+    # Measure against the last kept key, not the previous sample, so slow drift still leaves keys.
+    # last_near is the last sample still within half a tolerance of the anchor (where a hold ends).
+    anchor = last_near = 0
+    anchor_p = p[0]
+    aw, ax, ay, az = q[0]
+    for i in range(1, len(p)):
+        moved = False
+        near = True
+        if check_position:
+            distance = dist(anchor_p, p[i])
+            moved = distance > position_tolerance
+            near = distance <= near_distance
+        if check_rotation:
+            bw, bx, by, bz = q[i]
+            alignment = abs(aw * bw + ax * bx + ay * by + az * bz)
+            moved = moved or alignment < min_alignment
+            near = near and alignment >= near_alignment
+        if not moved:
+            if near:
+                last_near = i
+            continue
+        
+        # Keep the end of a hold, unless the move from the anchor passes close to it anyway
+        # (as in steady drift, where a key per tolerance step is enough)
+        if anchor < last_near < i and off_course(anchor, last_near, i):
+            keep[last_near] = True
+        
+        keep[i] = True
+        anchor = last_near = i
+        anchor_p = p[i]
+        aw, ax, ay, az = q[i]
+    return keep
+
+
+def _slot_fcurves(animation_data, create=False):
+    """F-Curves of the assigned action slot (the legacy action.fcurves before Blender 4.4)"""
+    action = animation_data.action
+    if bpy.app.version < (4, 4, 0):
+        return action.fcurves
+    
+    from bpy_extras import anim_utils
+    if create:
+        if animation_data.action_slot is None:
+            animation_data.action_slot = action.slots.new(id_type='OBJECT', name=animation_data.id_data.name)
+        return anim_utils.action_ensure_channelbag_for_slot(action, animation_data.action_slot).fcurves
+    
+    channelbag = anim_utils.action_get_channelbag_for_slot(action, animation_data.action_slot)
+    return channelbag.fcurves if channelbag else None
+
+
+def _keyframe_enum_value(prop, identifier):
+    """Integer value of a Keyframe enum item, as expected by foreach_set"""
+    return bpy.types.Keyframe.bl_rna.properties[prop].enum_items[identifier].value
+
+
+_SQRT_HALF = math.sqrt(0.5)
+
+# 90° rotation around X (WXYZ) from WebXR Y-up to Blender Z-up, and its inverse
+_BASIS_Q = (_SQRT_HALF, _SQRT_HALF, 0.0, 0.0)
+_BASIS_Q_INV = (_SQRT_HALF, -_SQRT_HALF, 0.0, 0.0)
+
+
+# Position axis order and signs: WebXR (x, y, z) -> Blender (x, -z, y) and back
+_TO_BLENDER_AXES = ((0, 2, 1), (1.0, -1.0, 1.0))
+_TO_WEBXR_AXES = ((0, 2, 1), (1.0, 1.0, -1.0))
+_IDENTITY_AXES = ((0, 1, 2), (1.0, 1.0, 1.0))
+
+
+def _rotate_about_x(q, basis):
+    """Left-multiply WXYZ quaternion arrays by an X-axis rotation (w, x, 0, 0)"""
+    import numpy as np
+    bw, bx = basis[0], basis[1]
+    qw, qx, qy, qz = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    return np.column_stack((
+        bw * qw - bx * qx,
+        bw * qx + bx * qw,
+        bw * qy - bx * qz,
+        bw * qz + bx * qy,
+    ))
+
+
+def _quat_mul(a, b):
+    """Hamilton product of WXYZ quaternion arrays (broadcasts over leading axes)"""
+    import numpy as np
+    aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
 
 
 class WebXRCameraAnimationImporter(bpy.types.Operator, ImportHelper):
@@ -74,12 +234,31 @@ class WebXRCameraAnimationImporter(bpy.types.Operator, ImportHelper):
         min=1.0,
         max=120.0,
     )
+    
+    position_tolerance: FloatProperty(
+        name="Position Tolerance",
+        description="Skip keyframes until the camera moves more than this from the last key (0 ignores position)",
+        default=0.0,
+        min=0.0,
+        max=1.0,
+        precision=4,
+        subtype='DISTANCE',
+    )
+    
+    rotation_tolerance: FloatProperty(
+        name="Rotation Tolerance",
+        description="Skip keyframes until the camera turns more than this from the last key (0 ignores rotation)",
+        default=0.0,
+        min=0.0,
+        max=math.radians(10.0),
+        subtype='ANGLE',
+    )
 
     def execute(self, context):
         try:
             # Read JSON file
-            with open(self.filepath, 'r') as f:
-                data = json.load(f)
+            path = Path(self.filepath)
+            data = _read_json(path)
             
             # Validate data
             if 'frames' not in data or not isinstance(data['frames'], list):
@@ -91,6 +270,8 @@ class WebXRCameraAnimationImporter(bpy.types.Operator, ImportHelper):
                 self.report({'ERROR'}, "No frames found in animation data")
                 return {'CANCELLED'}
             
+            times, q, p = _parse_frames(frames)
+            
             # Get or create camera
             camera = self._get_or_create_camera(context)
             if not camera:
@@ -98,14 +279,13 @@ class WebXRCameraAnimationImporter(bpy.types.Operator, ImportHelper):
                 return {'CANCELLED'}
             
             # Import animation
-            self._import_animation(camera, frames, data)
+            self._import_animation(camera, times, q, p, data, path.stem, path.name)
             
             # Set active object and frame range
             context.view_layer.objects.active = camera
             camera.select_set(True)
             
-            filename = Path(self.filepath).stem
-            self.report({'INFO'}, f"Imported {len(frames)} frames from '{filename}'")
+            self.report({'INFO'}, f"Imported {len(times)} frames from '{path.stem}'")
             
             return {'FINISHED'}
             
@@ -131,12 +311,13 @@ class WebXRCameraAnimationImporter(bpy.types.Operator, ImportHelper):
         
         return None
 
-    def _import_animation(self, camera, frames, metadata):
+    def _import_animation(self, camera, times, q, p, metadata, source_stem, source_name):
         """Import animation frames as keyframes"""
+        import numpy as np
         scene = bpy.context.scene
         
         # Calculate frame timing
-        duration = frames[-1]['t']
+        duration = float(times[-1])
         total_frames = int(duration * self.frame_rate)
         
         # Set scene frame range
@@ -145,9 +326,6 @@ class WebXRCameraAnimationImporter(bpy.types.Operator, ImportHelper):
         scene.render.fps = int(self.frame_rate)
         
         # Store initial position/rotation if applying deltas
-        initial_pos = Vector((0, 0, 0))
-        initial_rot = Quaternion((1, 0, 0, 0))
-        
         if self.apply_deltas:
             initial_pos = camera.location.copy()
             initial_rot = camera.rotation_quaternion.copy() if camera.rotation_mode == 'QUATERNION' else camera.rotation_euler.to_quaternion()
@@ -160,103 +338,118 @@ class WebXRCameraAnimationImporter(bpy.types.Operator, ImportHelper):
             camera.animation_data_clear()
         
         # Create action
-        action_name = f"WebXR_Anim_{Path(self.filepath).stem}"
+        action_name = f"WebXR_Anim_{source_stem}"
         action = bpy.data.actions.new(name=action_name)
         camera.animation_data_create()
         camera.animation_data.action = action
+        fcurves = _slot_fcurves(camera.animation_data, create=True)
         
-        # Get first frame data for delta calculation
-        first_frame = frames[0]
-        q0 = Quaternion((first_frame['q'][3], first_frame['q'][0], first_frame['q'][1], first_frame['q'][2]))
-        p0 = Vector((first_frame['p'][0], first_frame['p'][1], first_frame['p'][2])) if 'p' in first_frame else Vector((0, 0, 0))
+        # Apply coordinate system conversion (WebXR Y-up to Blender Z-up)
+        if self.coordinate_system == 'BLENDER':
+            axes, signs = _TO_BLENDER_AXES
+            
+            # Rotation: Apply 90° rotation around X to convert coordinate systems
+            # In WebXR Y-up: forward=-Z, up=+Y, right=+X
+            # In Blender Z-up: forward=-Y, up=+Z, right=+X
+            # We need to rotate the quaternion to match this transform
+            q_converted = _rotate_about_x(q, _BASIS_Q)  # 90° around X axis
+        else:
+            axes, signs = _IDENTITY_AXES
+            q_converted = q
         
-        # Import each frame
-        for frame_data in frames:
-            time = frame_data['t']
-            frame_number = int(time * self.frame_rate) + 1
-            
-            # Parse quaternion (XYZW in JSON -> WXYZ in Blender)
-            q = Quaternion((
-                frame_data['q'][3],  # W
-                frame_data['q'][0],  # X
-                frame_data['q'][1],  # Y
-                frame_data['q'][2]   # Z
-            ))
-            
-            # Parse position if available
-            p = Vector((0, 0, 0))
-            if 'p' in frame_data and frame_data['p']:
-                p = Vector((
-                    frame_data['p'][0],
-                    frame_data['p'][1],
-                    frame_data['p'][2]
-                ))
-            
-            # Apply coordinate system conversion (WebXR Y-up to Blender Z-up)
-            if self.coordinate_system == 'BLENDER':
-                # Convert Y-up (WebXR) to Z-up (Blender)
-                # Position: Y and Z swap, negate new Z
-                p_converted = Vector((p.x, -p.z, p.y))
-                
-                # Rotation: Apply 90° rotation around X to convert coordinate systems
-                # In WebXR Y-up: forward=-Z, up=+Y, right=+X
-                # In Blender Z-up: forward=-Y, up=+Z, right=+X
-                # We need to rotate the quaternion to match this transform
-                basis_rotation = Quaternion((0.7071068, 0.7071068, 0, 0))  # 90° around X axis
-                q_converted = basis_rotation @ q
-            else:
-                q_converted = q
-                p_converted = p
-            
-            # Apply scale
-            p_converted *= self.scale_factor
-            
-            # Apply deltas if requested (relative to initial pose)
-            if self.apply_deltas:
-                # Calculate delta rotation: initial^-1 * q0^-1 * q
-                q_delta = q0.inverted() @ q_converted
-                q_final = initial_rot @ q_delta
-                
-                # Calculate delta position in initial orientation space
-                p_delta = p_converted - p0
-                if self.coordinate_system == 'BLENDER':
-                    p_delta_rotated = initial_rot @ p_delta
-                else:
-                    p_delta_rotated = p_delta
-                p_final = initial_pos + p_delta_rotated
-            else:
-                q_final = q_converted
-                p_final = p_converted
-            
-            # Set frame
-            scene.frame_set(frame_number)
-            
-            # Apply transform
-            camera.location = p_final
-            camera.rotation_quaternion = q_final
-            
-            # Insert keyframes
-            camera.keyframe_insert(data_path="location", frame=frame_number)
-            camera.keyframe_insert(data_path="rotation_quaternion", frame=frame_number)
-        
-        # Set interpolation to bezier for smooth motion
-        if camera.animation_data and camera.animation_data.action:
-            for fcurve in camera.animation_data.action.fcurves:
-                for keyframe in fcurve.keyframe_points:
-                    keyframe.interpolation = 'BEZIER'
-                    keyframe.handle_left_type = 'AUTO_CLAMPED'
-                    keyframe.handle_right_type = 'AUTO_CLAMPED'
+        # Swizzle, sign-flip and scale positions in a single pass
+        p_converted = p[:, axes] * (np.array(signs) * self.scale_factor)
+        
+        # Apply deltas if requested (relative to initial pose)
+        if self.apply_deltas:
+            q_final, p_final = self._apply_deltas(q_converted, p_converted, q[0], p[0], initial_rot, initial_pos)
+        else:
+            q_final = q_converted
+            p_final = p_converted
+        
+        # Several samples can land on the same frame (or arrive out of order); as with
+        # repeated keyframe_insert, the last sample for a frame wins
+        frame_numbers = (times * self.frame_rate).astype(np.int64) + 1
+        order = np.argsort(frame_numbers, kind='stable')
+        frame_numbers = frame_numbers[order]
+        last = np.append(frame_numbers[1:] != frame_numbers[:-1], True)
+        frame_numbers = frame_numbers[last]
+        p_final = p_final[order[last]]
+        q_final = q_final[order[last]]
+        
+        # Drop samples inside held poses, keeping the keys that bound each hold
+        if self.position_tolerance > 0.0 or self.rotation_tolerance > 0.0:
+            keep = _motion_keys(p_final, q_final, self.position_tolerance, self.rotation_tolerance)
+            frame_numbers = frame_numbers[keep]
+            p_final = p_final[keep]
+            q_final = q_final[keep]
+        
+        # Write all keyframes in one pass per F-Curve
+        for index in range(3):
+            self._write_fcurve(fcurves, "location", index, frame_numbers, p_final[:, index])
+        for index in range(4):
+            self._write_fcurve(fcurves, "rotation_quaternion", index, frame_numbers, q_final[:, index])
         
         # Reset to first frame
         scene.frame_set(1)
         
         # Store metadata as custom properties
-        camera["webxr_animation_source"] = Path(self.filepath).name
+        camera["webxr_animation_source"] = source_name
         camera["webxr_animation_duration"] = duration
-        camera["webxr_animation_frames"] = len(frames)
+        camera["webxr_animation_frames"] = len(times)
         if 'referenceSpaceType' in metadata:
             camera["webxr_reference_space"] = metadata['referenceSpaceType']
 
+    def _apply_deltas(self, q, p, q0, p0, initial_rot, initial_pos):
+        """Re-express converted motion relative to the first frame, starting from the initial pose"""
+        import numpy as np
+        
+        # Calculate delta rotation: initial^-1 * q0^-1 * q
+        # WebXR poses are unit quaternions, so the inverse is just the conjugate
+        q0_inv = q0 * (1.0, -1.0, -1.0, -1.0)
+        q_delta = _quat_mul(q0_inv, q)
+        q_final = _quat_mul(np.array(initial_rot), q_delta)
+        
+        # Calculate delta position in initial orientation space
+        p_delta = p - p0
+        if self.coordinate_system == 'BLENDER':
+            p_delta = p_delta @ np.array(initial_rot.to_matrix()).T
+        p_final = np.array(initial_pos) + p_delta
+        
+        return q_final, p_final
+
+    def _write_fcurve(self, fcurves, data_path, index, frame_numbers, values):
+        """Create an F-Curve and fill its keyframes in a single bulk write"""
+        import numpy as np
+        # Only keep needed keys: drop any that just repeat the value on both sides
+        if len(values) > 2:
+            repeated = values[1:] == values[:-1]
+            needed = np.ones(len(values), dtype=bool)
+            needed[1:-1] = ~(repeated[:-1] & repeated[1:])
+            frame_numbers = frame_numbers[needed]
+            values = values[needed]
+        
+        if bpy.app.version < (4, 4, 0):
+            fcurve = fcurves.new(data_path=data_path, index=index, action_group="WebXR")
+        else:
+            fcurve = fcurves.ensure(data_path, index=index, group_name="WebXR")
+        count = len(frame_numbers)
+        fcurve.keyframe_points.add(count)
+        
+        # Interleave (frame, value) pairs into a float32 buffer matching Blender's storage
+        co = np.empty(2 * count, dtype=np.float32)
+        co[0::2] = frame_numbers
+        co[1::2] = values
+        fcurve.keyframe_points.foreach_set("co", co)
+        
+        # Bezier interpolation with auto-clamped handles for smooth motion
+        interpolation = np.full(count, _keyframe_enum_value("interpolation", 'BEZIER'), dtype=np.int32)
+        handle_type = np.full(count, _keyframe_enum_value("handle_left_type", 'AUTO_CLAMPED'), dtype=np.int32)
+        fcurve.keyframe_points.foreach_set("interpolation", interpolation)
+        fcurve.keyframe_points.foreach_set("handle_left_type", handle_type)
+        fcurve.keyframe_points.foreach_set("handle_right_type", handle_type)
+        fcurve.update()
+
 
 class WebXRCameraAnimationExporter(bpy.types.Operator, ExportHelper):
     """Export WebXR Camera Animation JSON"""
@@ -333,6 +526,12 @@ class WebXRCameraAnimationExporter(bpy.types.Operator, ExportHelper):
         ],
         default='local-floor',
     )
+    
+    bake_world_transform: BoolProperty(
+        name="Bake World Transform",
+        description="Sample the fully evaluated world transform at every frame (needed for parented or constrained cameras, slower)",
+        default=False,
+    )
 
     def execute(self, context):
         try:
@@ -351,8 +550,7 @@ class WebXRCameraAnimationExporter(bpy.types.Operator, ExportHelper):
             animation_data = self._export_animation(context, camera)
             
             # Write JSON file
-            with open(self.filepath, 'w') as f:
-                json.dump(animation_data, f, indent=2)
+            _write_json(self.filepath, animation_data)
             
             filename = Path(self.filepath).name
             frame_count = len(animation_data['frames'])
@@ -377,78 +575,52 @@ class WebXRCameraAnimationExporter(bpy.types.Operator, ExportHelper):
 
     def _export_animation(self, context, camera):
         """Export animation frames as JSON"""
+        import numpy as np
         scene = context.scene
         
         # Determine frames to sample
         frames_to_sample = self._get_frames_to_sample(camera, scene)
         
-        # Store original frame and rotation mode
-        original_frame = scene.frame_current
-        original_rotation_mode = camera.rotation_mode
-        
-        # Temporarily set to quaternion for export
-        needs_quaternion_conversion = camera.rotation_mode != 'QUATERNION'
-        if needs_quaternion_conversion:
-            camera.rotation_mode = 'QUATERNION'
+        # Sample position (N,3) and rotation (N,4 WXYZ quaternion) at each frame
+        if self.bake_world_transform:
+            p, q = self._sample_world_transforms(camera, scene, frames_to_sample)
+        else:
+            p, q = self._sample_fcurves(camera, frames_to_sample)
         
-        # Export frames
-        exported_frames = []
+        # Calculate timestamps
         fps = scene.render.fps
+        times = (frames_to_sample - scene.frame_start) / fps
         
-        for frame_num in frames_to_sample:
-            scene.frame_set(frame_num)
-            
-            # Calculate timestamp
-            time = (frame_num - scene.frame_start) / fps
-            
-            # Get rotation (quaternion)
-            q = camera.rotation_quaternion.copy()
-            
-            # Get position
-            p = camera.location.copy()
+        # Apply coordinate system conversion (Blender Z-up to WebXR Y-up)
+        if self.coordinate_system == 'WEBXR':
+            axes, signs = _TO_WEBXR_AXES
             
-            # Apply coordinate system conversion (Blender Z-up to WebXR Y-up)
-            if self.coordinate_system == 'WEBXR':
-                # Convert Z-up (Blender) to Y-up (WebXR)
-                # Position: swap Y and Z, negate new Z
-                p_converted = Vector((p.x, p.z, -p.y))
-                
-                # Rotation: Inverse of import rotation
-                # Apply -90° rotation around X to convert back
-                basis_rotation_inv = Quaternion((0.7071068, -0.7071068, 0, 0))  # -90° around X
-                q_converted = basis_rotation_inv @ q
-            else:
-                q_converted = q
-                p_converted = p
-            
-            # Apply scale (inverse of import)
-            p_converted /= self.scale_factor
-            
-            # Build frame data
-            frame_data = {
-                "t": round(time, 4),
-                "q": [
-                    round(q_converted.x, 6),
-                    round(q_converted.y, 6),
-                    round(q_converted.z, 6),
-                    round(q_converted.w, 6)
-                ]
-            }
-            
-            # Add position if requested
-            if self.export_position:
-                frame_data["p"] = [
-                    round(p_converted.x, 6),
-                    round(p_converted.y, 6),
-                    round(p_converted.z, 6)
-                ]
-            
-            exported_frames.append(frame_data)
+            # Rotation: Inverse of import rotation
+            # Apply -90° rotation around X to convert back
+            q_converted = _rotate_about_x(q, _BASIS_Q_INV)  # -90° around X
+        else:
+            axes, signs = _IDENTITY_AXES
+            q_converted = q
         
-        # Restore original state
-        scene.frame_set(original_frame)
-        if needs_quaternion_conversion:
-            camera.rotation_mode = original_rotation_mode
+        # Swizzle, sign-flip and apply inverse scale to positions in a single pass
+        p_converted = p[:, axes] * (np.array(signs) / self.scale_factor)
+        
+        # Round all values at once (quaternions WXYZ in Blender -> XYZW in JSON)
+        times = np.round(times, 4)
+        q_out = np.round(q_converted[:, [1, 2, 3, 0]], 6)
+        p_out = np.round(p_converted, 6)
+        
+        # Build frame data, converting each array to Python lists in one call
+        if self.export_position:
+            exported_frames = [
+                {"t": t, "q": rot, "p": pos}
+                for t, rot, pos in zip(times.tolist(), q_out.tolist(), p_out.tolist())
+            ]
+        else:
+            exported_frames = [
+                {"t": t, "q": rot}
+                for t, rot in zip(times.tolist(), q_out.tolist())
+            ]
         
         # Build output JSON
         output = {
@@ -469,24 +641,78 @@ class WebXRCameraAnimationExporter(bpy.types.Operator, ExportHelper):
         
         return output
 
+    def _sample_fcurves(self, camera, frames_to_sample):
+        """Evaluate the camera's F-Curves directly, without changing the current frame"""
+        import numpy as np
+        fcurves = _slot_fcurves(camera.animation_data)
+        frames = frames_to_sample.tolist()
+        
+        def channel_values(data_path, defaults):
+            # Unanimated channels keep the camera's current value
+            values = []
+            for index, default in enumerate(defaults):
+                fcurve = fcurves.find(data_path, index=index) if fcurves is not None else None
+                if fcurve is None:
+                    values.append([default] * len(frames))
+                else:
+                    evaluate = fcurve.evaluate
+                    values.append([evaluate(frame) for frame in frames])
+            return zip(*values)
+        
+        locations = list(channel_values("location", camera.location))
+        
+        # Read whichever rotation channels Blender evaluates for this rotation mode
+        if camera.rotation_mode == 'QUATERNION':
+            rotations = list(channel_values("rotation_quaternion", camera.rotation_quaternion))
+        elif camera.rotation_mode == 'AXIS_ANGLE':
+            rotations = [Quaternion(v[1:], v[0]) for v in channel_values("rotation_axis_angle", camera.rotation_axis_angle)]
+        else:
+            rotations = [Euler(v, camera.rotation_mode).to_quaternion() for v in channel_values("rotation_euler", camera.rotation_euler)]
+        
+        return (
+            np.array(locations, dtype=np.float64).reshape(-1, 3),
+            np.array(rotations, dtype=np.float64).reshape(-1, 4),
+        )
+
+    def _sample_world_transforms(self, camera, scene, frames_to_sample):
+        """Step through the timeline and read the evaluated world transform"""
+        import numpy as np
+        original_frame = scene.frame_current
+        locations = np.empty((len(frames_to_sample), 3), dtype=np.float64)
+        rotations = np.empty((len(frames_to_sample), 4), dtype=np.float64)
+        
+        # Bind per-frame calls once to skip repeated RNA attribute lookups
+        frame_set = scene.frame_set
+        
+        for i, frame_num in enumerate(frames_to_sample.tolist()):
+            frame_set(frame_num)
+            # Copy components straight into the arrays (rotation is WXYZ)
+            matrix = camera.matrix_world
+            locations[i] = matrix.translation
+            rotations[i] = matrix.to_quaternion()
+        scene.frame_set(original_frame)
+        return locations, rotations
+
     def _get_frames_to_sample(self, camera, scene):
         """Determine which frames to sample based on sample mode"""
+        import numpy as np
         if self.sample_mode == 'KEYFRAMES':
-            # Get all keyframe positions
-            keyframe_numbers = set()
+            # Get all keyframe positions, reading each F-Curve's (frame, value) pairs in bulk
+            keyframe_times = [np.empty(0, dtype=np.float32)]
             if camera.animation_data and camera.animation_data.action:
-                for fcurve in camera.animation_data.action.fcurves:
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe_numbers.add(int(keyframe.co.x))
-            return sorted(keyframe_numbers)
+                for fcurve in _slot_fcurves(camera.animation_data) or ():
+                    co = np.empty(2 * len(fcurve.keyframe_points), dtype=np.float32)
+                    fcurve.keyframe_points.foreach_get("co", co)
+                    keyframe_times.append(co[0::2])
+            return np.unique(np.concatenate(keyframe_times).astype(np.int64))
         
         elif self.sample_mode == 'CUSTOM_RATE':
             # Sample every Nth frame
-            return list(range(scene.frame_start, scene.frame_end + 1, self.custom_sample_rate))
+            return np.arange(scene.frame_start, scene.frame_end + 1, self.custom_sample_rate)
         
         else:  # ALL_FRAMES
             # Sample every frame
-            return list(range(scene.frame_start, scene.frame_end + 1))
+            return np.arange(scene.frame_start, scene.frame_end + 1)
 
 
 class IMPORT_MT_webxr_camera_anim(bpy.types.Menu):